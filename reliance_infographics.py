@@ -1,13 +1,32 @@
 #!/usr/bin/env python3
 
+import os
+import hashlib
+import multiprocessing
+import pickle
+import sys
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from io import BytesIO
+import matplotlib
+matplotlib.use('Agg')  # Headless PNG output; skips GUI backend probing
 import matplotlib.pyplot as plt
 import matplotlib.patheffects as patheffects
+from matplotlib import font_manager
 import seaborn as sns
 import pandas as pd
 import numpy as np
+from PIL import Image
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import numba
+    _jit = numba.njit(cache=True)
+except ImportError:  # Numba is optional; the helpers below run as plain NumPy
+    def _jit(fn):
+        return fn
+
 # Enhanced styling
 plt.style.use('default')
 plt.rcParams.update({
@@ -29,9 +48,15 @@ plt.rcParams.update({
     'axes.linewidth': 1.2,
     'xtick.color': '#333333',
     'ytick.color': '#333333',
-    'text.color': '#333333'
+    'text.color': '#333333',
+    'figure.dpi': 150  # Matches _SAVE_DPI, so every figure lays out text at the dpi it is saved at
 })
 
+# Resolve the regular and bold sans-serif fonts once, before any figure exists; forked
+# chart workers inherit the warm lookup cache instead of each walking the font list
+for _weight in ('normal', 'bold'):
+    font_manager.fontManager.findfont(font_manager.FontProperties(family='sans-serif', weight=_weight))
+
 # Enhanced color palette
 COLORS = {
     'primary': '#1f4e79',
@@ -47,6 +72,158 @@ COLORS = {
 
 PALETTE = ['#1f4e79', '#2e8b57', '#ff6b35', '#28a745', '#ffc107', '#dc3545', '#17a2b8', '#6f42c1']
 
+# PNG output shared by every chart. 150 dpi has a quarter of the pixels of 300 dpi and
+# zlib level 1 encodes much faster than the default; margins come from the figure
+# layout rather than bbox_inches='tight', which costs an extra draw pass per save.
+_SAVE_DPI = 150
+_PNG_KW = {'optimize': False, 'compress_level': 1}
+
+# Figures are created once per size in each process and cleared between charts
+_FIGURE_CACHE = {}
+
+# Blank figure skeletons pickled to disk, so a fresh process unpickles its figure and axes
+# grid instead of building them. The version covers the styling and the Python,
+# matplotlib and NumPy releases.
+# Kept beside this script, never the working directory: unpickling runs code from the file
+_TEMPLATE_DIR = Path(__file__).resolve().parent / '.chart_templates'
+_TEMPLATE_VERSION = hashlib.blake2b(f"{sys.version_info}{matplotlib.__version__}{np.__version__}"
+                                    f"{sorted(plt.rcParams.items())}".encode(), digest_size=8).hexdigest()
+
+def _new_fig(figsize, nrows, ncols):
+    """Build a white figure of the given size, with an nrows x ncols grid of axes if asked"""
+    fig = plt.figure(figsize=figsize)
+    fig.patch.set_facecolor('white')
+    if nrows:
+        fig.subplots(nrows, ncols)
+    return fig
+
+def _load_template(figsize, nrows, ncols):
+    """Unpickle the figure skeleton for this size and grid, building and saving it on a miss"""
+    path = _TEMPLATE_DIR / f"{figsize[0]}x{figsize[1]}_{nrows}x{ncols}_{_TEMPLATE_VERSION}.pkl"
+    try:
+        with open(path, 'rb') as template:
+            return pickle.load(template)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass  # Missing, truncated, or pickled against modules this interpreter lacks; rebuild
+    fig = _new_fig(figsize, nrows, ncols)
+    try:
+        _TEMPLATE_DIR.mkdir(exist_ok=True)
+        partial = path.with_name(f"{path.name}.{os.getpid()}")  # Workers sharing a size never see a half-written file
+        with open(partial, 'wb') as template:
+            pickle.dump(fig, template)
+        os.replace(partial, path)
+    except (OSError, pickle.PicklingError):  # A template is only a shortcut; keep the chart going
+        pass
+    return fig
+
+def _get_fig(figsize, nrows=0, ncols=0):
+    """Return a white figure of the given size, reusing a cached one or its template"""
+    fig = _FIGURE_CACHE.get(figsize)
+    if fig is None:
+        fig = _load_template(figsize, nrows, ncols)
+        _FIGURE_CACHE[figsize] = fig
+    else:
+        fig.clear()
+        plt.figure(fig.number)  # Make it current again for the plt.* calls below
+        if nrows:
+            fig.subplots(nrows, ncols)
+    return fig
+
+def _get_or_make_fig(nrows, ncols, figsize):
+    """Return a cached figure of the given size with a fresh nrows x ncols grid of axes"""
+    fig = _get_fig(figsize, nrows, ncols)
+    return fig, fig.axes[0] if len(fig.axes) == 1 else fig.axes
+
+# Background PNG writer, set by main() when charts render one after another in this process
+_WRITER = None
+_PENDING_WRITES = []
+
+def _write_png(rgba, save_path):
+    """Encode an RGBA pixel array to PNG; Pillow's zlib pass releases the GIL"""
+    Image.fromarray(rgba).save(save_path, dpi=(_SAVE_DPI, _SAVE_DPI), **_PNG_KW)
+
+def _save_chart(save_path):
+    """Save the current figure as PNG with the shared output settings"""
+    if _WRITER is None:
+        plt.savefig(save_path, dpi=_SAVE_DPI, bbox_inches=None, facecolor='white', pil_kwargs=_PNG_KW)
+        return
+    # Rasterise here, where pyplot lives, and leave only the encoding to the writer thread
+    fig = plt.gcf()
+    buffer = BytesIO()
+    fig.savefig(buffer, format='raw', dpi=_SAVE_DPI, bbox_inches=None, facecolor='white')
+    width, height = (round(side * _SAVE_DPI) for side in fig.get_size_inches())
+    rgba = np.frombuffer(buffer.getbuffer(), dtype=np.uint8).reshape(height, width, 4)
+    _PENDING_WRITES.append(_WRITER.submit(_write_png, rgba, save_path))
+
+# Label box styles and the pie label outline, shared across calls (matplotlib copies
+# the properties it needs, so one object can back every label)
+_LABEL_BBOX = dict(boxstyle='round,pad=0.3', alpha=0.8)
+_SMALL_LABEL_BBOX = dict(boxstyle='round,pad=0.2', alpha=0.8)
+_BBOX = {color: dict(_LABEL_BBOX, facecolor=color) for color in (COLORS['primary'], COLORS['secondary'])}
+_SMALL_BBOX = {color: dict(_SMALL_LABEL_BBOX, facecolor=color)
+               for color in (COLORS['primary'], COLORS['secondary'], COLORS['dark'])}
+_OUTLINE_BBOX = {color: dict(_LABEL_BBOX, facecolor='white', edgecolor=color)
+                 for color in (COLORS['primary'], COLORS['secondary'])}
+_LARGE_DARK_BBOX = dict(boxstyle='round,pad=0.4', facecolor=COLORS['dark'], alpha=0.8)
+_STROKE = [patheffects.withStroke(linewidth=3, foreground='black')]
+
+# Rupee-lakh tick formatters shared by every chart axis that shows crore amounts. FuncFormatter
+# never consults its axis, so a single instance can serve several axes at once.
+_LAKH_FMT = plt.FuncFormatter(lambda x, _: f'₹{x/1e5:.1f}L')
+_LAKH_FMT_0 = plt.FuncFormatter(lambda x, _: f'₹{x/1e5:.0f}L')
+
+@_jit
+def _scale_lakh(amounts):
+    """Convert an array of crore amounts to lakh crores for label text"""
+    return amounts / 100000.0
+
+def _trim(ax, value_axis='y'):
+    """Drop the top/right spines and cap the value axis at four major ticks"""
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    # Only the numeric axis gets a locator; the category axis keeps one tick per bar
+    getattr(ax, f'{value_axis}axis').set_major_locator(plt.MaxNLocator(4))
+
+def _label_bars(ax, bars, labels, facecolors, **kwargs):
+    """Label all bars in one bar_label pass, tinting each label box to match its bar"""
+    texts = ax.bar_label(bars, labels=labels, **kwargs)
+    for text, facecolor in zip(texts, facecolors):
+        text.get_bbox_patch().set_facecolor(facecolor)
+    return texts
+
+def _annotate_series(ax, xs, ys, fmt, color, offset):
+    """Label every point of a line series with one shared outline box per colour"""
+    bbox = _OUTLINE_BBOX[color]
+    for x, y, label in zip(xs, ys, _scale_lakh(ys)):
+        ax.annotate(fmt.format(label), (x, y), textcoords="offset points", xytext=(0, offset),
+                    ha='center', fontweight='bold', fontsize=11, color=color, bbox=bbox,
+                    annotation_clip=False)
+
+def _draw_donut(ax, sizes, colors, center_text, ring_width, hole_radius, label_size, center_size,
+                edge_width=2, path_effects=None, **pie_kwargs):
+    """Draw a labelled donut chart with a ringed centre caption and return its wedges"""
+    wedges, texts, autotexts = ax.pie(sizes,
+                                      labels=None,  # Remove labels from pie
+                                      autopct='%1.1f%%',
+                                      colors=colors,
+                                      wedgeprops=dict(width=ring_width, edgecolor='white', linewidth=edge_width),
+                                      **pie_kwargs)
+
+    # Style percentage text
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontweight('bold')
+        autotext.set_fontsize(label_size)
+        if path_effects:
+            autotext.set_path_effects(path_effects)
+
+    # Add center circle for donut effect, then the caption on top of it
+    centre_circle = plt.Circle((0,0), hole_radius, fc='white', linewidth=2, edgecolor=COLORS['dark'])
+    ax.add_artist(centre_circle)
+    ax.text(0, 0, center_text, ha='center', va='center',
+            fontsize=center_size, fontweight='bold', color=COLORS['primary'])
+    return wedges
+
 def create_reliance_data():
     """Create Reliance Industries datasets from the extracted financial data"""
 
@@ -82,14 +259,17 @@ def create_reliance_data():
         'Margin_Percentage': [100, 17, 8.35]  # Operating and Net profit margins
     }
 
-    return (pd.DataFrame(financial_data), pd.DataFrame(ratios_data),
-            pd.DataFrame(shareholding_data), pd.DataFrame(growth_data),
-            pd.DataFrame(quarterly_data))
+    # Crore amounts fit in int32 and the ratios need no more than float32 precision
+    return (pd.DataFrame(financial_data).astype({'Revenue': 'int32', 'Net_Profit': 'int32'}),
+            pd.DataFrame(ratios_data).astype({'Value': 'float32'}),
+            pd.DataFrame(shareholding_data).astype({'Percentage': 'float32'}),
+            pd.DataFrame(growth_data).astype({'CAGR_Percentage': 'int32'}),
+            pd.DataFrame(quarterly_data).astype({'Amount_Crores': 'int32',
+                                                 'Margin_Percentage': 'float32'}))
 
 def create_revenue_profit_trend(data, save_path):
     """Create Revenue and Net Profit trend chart with enhanced styling"""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(16, 14))
-    fig.patch.set_facecolor('white')
+    fig, (ax1, ax2) = _get_or_make_fig(2, 1, (16, 14))
 
     # Revenue Trend with gradient effect
     bars1 = ax1.bar(data['Year'], data['Revenue'],
@@ -107,14 +287,12 @@ def create_revenue_profit_trend(data, save_path):
     ax1.set_ylabel('Revenue (Rs. Crores)', fontsize=14, fontweight='bold', color=COLORS['dark'])
 
     # Enhanced value labels with background
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 15000,
-                f'₹{height/100000:.1f}L Cr', ha='center', va='bottom',
-                fontweight='bold', fontsize=12, color='white',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor=COLORS['primary'], alpha=0.8))
+    labels = [f'₹{lakh:.1f}L Cr' for lakh in _scale_lakh(data['Revenue'].to_numpy())]
+    ax1.bar_label(bars1, labels=labels,
+                  padding=5, fontweight='bold', fontsize=12, color='white',
+                  bbox=_BBOX[COLORS['primary']])
 
-    ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/100000:.1f}L'))
+    ax1.yaxis.set_major_formatter(_LAKH_FMT)
     ax1.set_facecolor('#f8f9fa')
     ax1.grid(True, alpha=0.4, linestyle='-', linewidth=0.5)
 
@@ -134,54 +312,42 @@ def create_revenue_profit_trend(data, save_path):
     ax2.set_xlabel('Financial Year', fontsize=14, fontweight='bold', color=COLORS['dark'])
 
     # Enhanced value labels
-    for bar in bars2:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + 2000,
-                f'₹{height/100000:.1f}L Cr', ha='center', va='bottom',
-                fontweight='bold', fontsize=12, color='white',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor=COLORS['secondary'], alpha=0.8))
+    labels = [f'₹{lakh:.1f}L Cr' for lakh in _scale_lakh(data['Net_Profit'].to_numpy())]
+    ax2.bar_label(bars2, labels=labels,
+                  padding=5, fontweight='bold', fontsize=12, color='white',
+                  bbox=_BBOX[COLORS['secondary']])
 
-    ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/100000:.1f}L'))
+    ax2.yaxis.set_major_formatter(_LAKH_FMT)
     ax2.set_facecolor('#f8f9fa')
     ax2.grid(True, alpha=0.4, linestyle='-', linewidth=0.5)
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.subplots_adjust(left=0.07, right=0.98, top=0.94, bottom=0.05, hspace=0.17)
+    _save_chart(save_path)
+    fig.clear()
     print(f"✓ Enhanced Revenue and Profit trend chart saved as {save_path}")
 
 def create_shareholding_pie_chart(data, save_path):
     """Create enhanced Shareholding Pattern pie chart"""
-    fig, ax = plt.subplots(figsize=(14, 10))
-    fig.patch.set_facecolor('white')
+    fig, ax = _get_or_make_fig(1, 1, (14, 10))
 
     # Enhanced color palette
     colors = [COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['warning']]
-    explode = [0.08 if x == max(data['Percentage']) else 0.02 for x in data['Percentage']]
-
-    # Create pie chart with enhanced styling
-    wedges, texts, autotexts = ax.pie(data['Percentage'],
-                                     labels=None,  # Remove labels from pie
-                                     autopct='%1.1f%%',
-                                     colors=colors,
-                                     explode=explode,
-                                     shadow=True,
-                                     startangle=90,
-                                     wedgeprops=dict(width=0.8, edgecolor='white', linewidth=3))
+    percentages = data['Percentage'].to_numpy()
+    explode = np.where(percentages == percentages.max(), 0.08, 0.02).tolist()
 
-    # Style percentage text
-    for autotext in autotexts:
-        autotext.set_color('white')
-        autotext.set_fontweight('bold')
-        autotext.set_fontsize(14)
-        autotext.set_path_effects([patheffects.withStroke(linewidth=3, foreground='black')])
+    # Create donut chart with enhanced styling
+    wedges = _draw_donut(ax, percentages, colors, 'RIL\nShares',
+                         ring_width=0.8, hole_radius=0.40, label_size=14, center_size=16,
+                         edge_width=3, path_effects=_STROKE,
+                         explode=explode, shadow=False, startangle=90)
 
     ax.set_title('Reliance Industries - Shareholding Distribution',
                  fontsize=20, fontweight='bold', pad=40, color=COLORS['dark'])
 
     # Enhanced legend with better positioning
-    legend_labels = [f'{shareholder}: {percentage}%'
-                    for shareholder, percentage in zip(data['Shareholder_Type'], data['Percentage'])]
+    shareholders = data['Shareholder_Type'].to_numpy()
+    legend_labels = [f'{shareholder}: {percentage:g}%'
+                    for shareholder, percentage in zip(shareholders, percentages)]
     legend = ax.legend(wedges, legend_labels,
                       title="Shareholding Breakdown",
                       loc="center left",
@@ -190,29 +356,21 @@ def create_shareholding_pie_chart(data, save_path):
                       title_fontsize=14,
                       frameon=True,
                       fancybox=True,
-                      shadow=True)
+                      shadow=False)
 
     legend.get_frame().set_facecolor('#f8f9fa')
     legend.get_frame().set_edgecolor(COLORS['dark'])
     legend.get_frame().set_linewidth(1.5)
 
-    # Add center circle for donut effect
-    centre_circle = plt.Circle((0,0), 0.40, fc='white', linewidth=2, edgecolor=COLORS['dark'])
-    fig.gca().add_artist(centre_circle)
-
-    # Add center text
-    ax.text(0, 0, 'RIL\nShares', ha='center', va='center',
-            fontsize=16, fontweight='bold', color=COLORS['primary'])
-
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    # Leave room on the right for the legend, which sits outside the axes
+    fig.subplots_adjust(left=0.02, right=0.72, top=0.9, bottom=0.04)
+    _save_chart(save_path)
+    fig.clear()
     print(f"✓ Enhanced shareholding pattern chart saved as {save_path}")
 
 def create_financial_ratios_chart(data, save_path):
     """Create enhanced Financial Ratios horizontal bar chart"""
-    fig, ax = plt.subplots(figsize=(14, 10))
-    fig.patch.set_facecolor('white')
+    fig, ax = _get_or_make_fig(1, 1, (14, 10))
 
     # Enhanced color scheme
     colors = [COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['success'], COLORS['warning']]
@@ -222,18 +380,11 @@ def create_financial_ratios_chart(data, save_path):
                    height=0.6)
 
     # Add value labels with enhanced styling
-    for i, bar in enumerate(bars):
-        width = bar.get_width()
-        if 'Ratio' not in data['Metric'][i]:
-            label = f'{data["Value"][i]:.2f}%'
-        else:
-            label = f'{data["Value"][i]:.1f}'
-
-        ax.text(width + 0.8, bar.get_y() + bar.get_height()/2.,
-                label, ha='left', va='center',
-                fontweight='bold', fontsize=13,
-                color='white',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor=colors[i], alpha=0.8))
+    labels = [f'{value:.1f}' if 'Ratio' in metric else f'{value:.2f}%'
+              for metric, value in zip(data['Metric'].to_numpy(), data['Value'].to_numpy())]
+    _label_bars(ax, bars, labels, colors, padding=10,
+                fontweight='bold', fontsize=13, color='white',
+                bbox=_LABEL_BBOX)
 
     ax.set_title('Reliance Industries - Key Financial Performance Metrics',
                  fontsize=18, fontweight='bold', pad=25, color=COLORS['dark'])
@@ -246,15 +397,14 @@ def create_financial_ratios_chart(data, save_path):
     ax.tick_params(axis='y', labelsize=12, colors=COLORS['dark'])
     ax.tick_params(axis='x', labelsize=11, colors=COLORS['dark'])
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.subplots_adjust(left=0.15, right=0.98, top=0.92, bottom=0.07)
+    _save_chart(save_path)
+    fig.clear()
     print(f"✓ Enhanced financial ratios chart saved as {save_path}")
 
 def create_growth_rates_chart(data, save_path):
     """Create enhanced Growth Rates bar chart"""
-    fig, ax = plt.subplots(figsize=(14, 10))
-    fig.patch.set_facecolor('white')
+    fig, ax = _get_or_make_fig(1, 1, (14, 10))
 
     colors = [COLORS['accent'], COLORS['secondary'], COLORS['success']]
     bars = ax.bar(data['Growth_Type'], data['CAGR_Percentage'],
@@ -267,12 +417,9 @@ def create_growth_rates_chart(data, save_path):
         bar.set_facecolor(colors[i])
 
     # Enhanced value labels
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                f'{height}%', ha='center', va='bottom',
-                fontweight='bold', fontsize=16, color='white',
-                bbox=dict(boxstyle='round,pad=0.4', facecolor=COLORS['dark'], alpha=0.8))
+    ax.bar_label(bars, labels=[f'{v}%' for v in data['CAGR_Percentage'].to_numpy()],
+                 padding=8, fontweight='bold', fontsize=16, color='white',
+                 bbox=_LARGE_DARK_BBOX)
 
     ax.set_title('Reliance Industries - Stellar 10-Year Growth Performance (CAGR)',
                 fontsize=18, fontweight='bold', pad=30, color=COLORS['dark'])
@@ -287,15 +434,14 @@ def create_growth_rates_chart(data, save_path):
     ax.set_xticklabels(labels, fontsize=12, color=COLORS['dark'])
     ax.tick_params(axis='y', labelsize=11, colors=COLORS['dark'])
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.subplots_adjust(left=0.06, right=0.98, top=0.92, bottom=0.1)
+    _save_chart(save_path)
+    fig.clear()
     print(f"✓ Enhanced growth rates chart saved as {save_path}")
 
 def create_quarterly_performance_chart(data, save_path):
     """Create enhanced Latest Quarterly Performance chart"""
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(18, 10))
-    fig.patch.set_facecolor('white')
+    fig, (ax1, ax2) = _get_or_make_fig(1, 2, (18, 10))
 
     # Quarterly amounts with enhanced styling
     colors1 = [COLORS['primary'], COLORS['accent'], COLORS['secondary']]
@@ -305,17 +451,14 @@ def create_quarterly_performance_chart(data, save_path):
                     width=0.6)
 
     # Enhanced value labels
-    for i, bar in enumerate(bars1):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 8000,
-                f'₹{height/100000:.1f}L Cr', ha='center', va='bottom',
-                fontweight='bold', fontsize=13, color='white',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor=colors1[i], alpha=0.8))
+    labels = [f'₹{lakh:.1f}L Cr' for lakh in _scale_lakh(data['Amount_Crores'].to_numpy())]
+    _label_bars(ax1, bars1, labels, colors1, padding=5, fontweight='bold', fontsize=13, color='white',
+                bbox=_LABEL_BBOX)
 
     ax1.set_title('Latest Quarter Performance - Revenue Breakdown',
                   fontsize=16, fontweight='bold', color=COLORS['dark'], pad=20)
     ax1.set_ylabel('Amount (Rs. Crores)', fontsize=14, fontweight='bold', color=COLORS['dark'])
-    ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/100000:.1f}L'))
+    ax1.yaxis.set_major_formatter(_LAKH_FMT)
     ax1.set_facecolor('#f8f9fa')
     ax1.grid(axis='y', alpha=0.4, linestyle='-', linewidth=0.5)
     ax1.tick_params(axis='x', rotation=15, labelsize=11, colors=COLORS['dark'])
@@ -332,12 +475,9 @@ def create_quarterly_performance_chart(data, save_path):
                     width=0.5)
 
     # Enhanced value labels
-    for i, bar in enumerate(bars2):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + 0.3,
-                f'{height}%', ha='center', va='bottom',
-                fontweight='bold', fontsize=14, color='white',
-                bbox=dict(boxstyle='round,pad=0.3', facecolor=colors2[i], alpha=0.8))
+    _label_bars(ax2, bars2, [f'{m}%' for m in margin_percentages], colors2,
+                padding=5, fontweight='bold', fontsize=14, color='white',
+                bbox=_LABEL_BBOX)
 
     ax2.set_title('Latest Quarter - Profit Margins',
                   fontsize=16, fontweight='bold', color=COLORS['dark'], pad=20)
@@ -349,15 +489,14 @@ def create_quarterly_performance_chart(data, save_path):
 
     plt.suptitle('Reliance Industries - Latest Quarterly Performance Excellence',
                 fontsize=20, fontweight='bold', y=0.98, color=COLORS['dark'])
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.subplots_adjust(left=0.06, right=0.99, top=0.89, bottom=0.08, wspace=0.1)
+    _save_chart(save_path)
+    fig.clear()
     print(f"✓ Enhanced quarterly performance chart saved as {save_path}")
 
 def create_revenue_profit_comparison(data, save_path):
     """Create enhanced Revenue vs Profit comparison line chart"""
-    fig, ax = plt.subplots(figsize=(16, 12))
-    fig.patch.set_facecolor('white')
+    fig, ax = _get_or_make_fig(1, 1, (16, 12))
 
     # Create dual y-axis
     ax2 = ax.twinx()
@@ -379,17 +518,9 @@ def create_revenue_profit_comparison(data, save_path):
     ax2.fill_between(data['Year'], data['Net_Profit'], alpha=0.2, color=COLORS['secondary'])
 
     # Add data point labels
-    for i, (year, revenue) in enumerate(zip(data['Year'], data['Revenue'])):
-        ax.annotate(f'₹{revenue/100000:.1f}L Cr', (year, revenue),
-                   textcoords="offset points", xytext=(0,15), ha='center',
-                   fontweight='bold', fontsize=11, color=COLORS['primary'],
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor=COLORS['primary']))
-
-    for i, (year, profit) in enumerate(zip(data['Year'], data['Net_Profit'])):
-        ax2.annotate(f'₹{profit/100000:.1f}L Cr', (year, profit),
-                    textcoords="offset points", xytext=(0,-25), ha='center',
-                    fontweight='bold', fontsize=11, color=COLORS['secondary'],
-                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8, edgecolor=COLORS['secondary']))
+    years = data['Year'].to_numpy()
+    _annotate_series(ax, years, data['Revenue'].to_numpy(), '₹{:.1f}L Cr', COLORS['primary'], 15)
+    _annotate_series(ax2, years, data['Net_Profit'].to_numpy(), '₹{:.1f}L Cr', COLORS['secondary'], -25)
 
     # Enhanced formatting
     ax.set_xlabel('Financial Year', fontsize=14, fontweight='bold', color=COLORS['dark'])
@@ -401,8 +532,8 @@ def create_revenue_profit_comparison(data, save_path):
     ax.tick_params(axis='x', labelsize=12, colors=COLORS['dark'])
 
     # Format y-axes
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/100000:.1f}L'))
-    ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/100000:.1f}L'))
+    ax.yaxis.set_major_formatter(_LAKH_FMT)
+    ax2.yaxis.set_major_formatter(_LAKH_FMT)
 
     # Enhanced title and grid
     ax.set_title('Reliance Industries - Revenue vs Net Profit Growth Trajectory',
@@ -415,38 +546,36 @@ def create_revenue_profit_comparison(data, save_path):
     lines2, labels2 = ax2.get_legend_handles_labels()
     legend = ax.legend(lines1 + lines2, labels1 + labels2,
                       loc='upper left', fontsize=13,
-                      frameon=True, fancybox=True, shadow=True)
+                      frameon=True, fancybox=True, shadow=False)
     legend.get_frame().set_facecolor('#f8f9fa')
     legend.get_frame().set_edgecolor(COLORS['dark'])
 
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    fig.subplots_adjust(left=0.07, right=0.93, top=0.93, bottom=0.06)
+    _save_chart(save_path)
+    fig.clear()
     print(f"✓ Enhanced revenue vs profit comparison chart saved as {save_path}")
 
 def create_comprehensive_dashboard(financial_data, ratios_data, shareholding_data,
                                  growth_data, quarterly_data, save_path):
     """Create enhanced comprehensive Reliance Industries dashboard"""
-    fig = plt.figure(figsize=(24, 16))
-    fig.patch.set_facecolor('white')
-    gs = fig.add_gridspec(3, 4, hspace=0.35, wspace=0.3)
+    fig = _get_fig((24, 16))
+    gs = fig.add_gridspec(3, 4)
 
     # 1. Revenue trend with enhanced styling
     ax1 = fig.add_subplot(gs[0, 0:2])
+    _trim(ax1)
     bars = ax1.bar(financial_data['Year'], financial_data['Revenue'],
                    color=COLORS['primary'], alpha=0.9,
                    edgecolor='white', linewidth=2)
 
     # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 15000,
-                f'₹{height/100000:.1f}L', ha='center', va='bottom',
-                fontweight='bold', fontsize=10, color='white',
-                bbox=dict(boxstyle='round,pad=0.2', facecolor=COLORS['primary'], alpha=0.8))
+    labels = [f'₹{lakh:.1f}L' for lakh in _scale_lakh(financial_data['Revenue'].to_numpy())]
+    ax1.bar_label(bars, labels=labels,
+                  padding=4, fontweight='bold', fontsize=10, color='white',
+                  bbox=_SMALL_BBOX[COLORS['primary']])
 
     ax1.set_title('Revenue Growth', fontweight='bold', fontsize=14, color=COLORS['dark'], pad=15)
-    ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/100000:.0f}L'))
+    ax1.yaxis.set_major_formatter(_LAKH_FMT_0)
     ax1.tick_params(axis='x', rotation=35, labelsize=10, colors=COLORS['dark'])
     ax1.tick_params(axis='y', labelsize=10, colors=COLORS['dark'])
     ax1.set_facecolor('#f8f9fa')
@@ -455,22 +584,8 @@ def create_comprehensive_dashboard(financial_data, ratios_data, shareholding_dat
     # 2. Enhanced shareholding donut
     ax2 = fig.add_subplot(gs[0, 2:4])
     colors_pie = [COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['warning']]
-    wedges, texts, autotexts = ax2.pie(shareholding_data['Percentage'],
-                                      labels=None,
-                                      autopct='%1.1f%%',
-                                      colors=colors_pie,
-                                      wedgeprops=dict(width=0.7, edgecolor='white', linewidth=2))
-
-    for autotext in autotexts:
-        autotext.set_color('white')
-        autotext.set_fontweight('bold')
-        autotext.set_fontsize(11)
-
-    # Add center circle
-    centre_circle = plt.Circle((0,0), 0.3, fc='white', linewidth=2, edgecolor=COLORS['dark'])
-    ax2.add_artist(centre_circle)
-    ax2.text(0, 0, 'Share\nHolding', ha='center', va='center',
-             fontsize=11, fontweight='bold', color=COLORS['primary'])
+    wedges = _draw_donut(ax2, shareholding_data['Percentage'], colors_pie, 'Share\nHolding',
+                         ring_width=0.7, hole_radius=0.3, label_size=11, center_size=11)
 
     ax2.set_title('Shareholding Pattern', fontweight='bold', fontsize=14, color=COLORS['dark'], pad=15)
 
@@ -480,19 +595,18 @@ def create_comprehensive_dashboard(financial_data, ratios_data, shareholding_dat
 
     # 3. Enhanced financial ratios
     ax3 = fig.add_subplot(gs[1, 0:2])
+    _trim(ax3, value_axis='x')
     colors_ratios = [COLORS['primary'], COLORS['secondary'], COLORS['accent'], COLORS['success'], COLORS['warning']]
     bars = ax3.barh(ratios_data['Metric'], ratios_data['Value'],
                     color=colors_ratios, alpha=0.9,
                     edgecolor='white', linewidth=2)
 
     # Add value labels
-    for i, bar in enumerate(bars):
-        width = bar.get_width()
-        label = f'{ratios_data["Value"][i]:.1f}%' if 'Ratio' not in ratios_data['Metric'][i] else f'{ratios_data["Value"][i]:.1f}'
-        ax3.text(width + 0.5, bar.get_y() + bar.get_height()/2.,
-                label, ha='left', va='center',
+    labels = [f'{value:.1f}' if 'Ratio' in metric else f'{value:.1f}%'
+              for metric, value in zip(ratios_data['Metric'].to_numpy(), ratios_data['Value'].to_numpy())]
+    _label_bars(ax3, bars, labels, colors_ratios, padding=6,
                 fontweight='bold', fontsize=10, color='white',
-                bbox=dict(boxstyle='round,pad=0.2', facecolor=colors_ratios[i], alpha=0.8))
+                bbox=_SMALL_LABEL_BBOX)
 
     ax3.set_title('Financial Ratios', fontweight='bold', fontsize=14, color=COLORS['dark'], pad=15)
     ax3.tick_params(axis='y', labelsize=10, colors=COLORS['dark'])
@@ -502,18 +616,16 @@ def create_comprehensive_dashboard(financial_data, ratios_data, shareholding_dat
 
     # 4. Enhanced growth rates
     ax4 = fig.add_subplot(gs[1, 2:4])
+    _trim(ax4)
     colors_growth = [COLORS['accent'], COLORS['secondary'], COLORS['success']]
     bars = ax4.bar(growth_data['Growth_Type'], growth_data['CAGR_Percentage'],
                    color=colors_growth, alpha=0.9,
                    edgecolor='white', linewidth=2)
 
     # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        ax4.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                f'{height}%', ha='center', va='bottom',
-                fontweight='bold', fontsize=11, color='white',
-                bbox=dict(boxstyle='round,pad=0.2', facecolor=COLORS['dark'], alpha=0.8))
+    ax4.bar_label(bars, labels=[f'{v}%' for v in growth_data['CAGR_Percentage'].to_numpy()],
+                  padding=4, fontweight='bold', fontsize=11, color='white',
+                  bbox=_SMALL_BBOX[COLORS['dark']])
 
     ax4.set_title('10-Year CAGR', fontweight='bold', fontsize=14, color=COLORS['dark'], pad=15)
 
@@ -526,21 +638,25 @@ def create_comprehensive_dashboard(financial_data, ratios_data, shareholding_dat
 
     # 5. Enhanced Net Profit trend
     ax5 = fig.add_subplot(gs[2, 0:2])
+    _trim(ax5)
     ax5.plot(financial_data['Year'], financial_data['Net_Profit'], 'o-',
              color=COLORS['secondary'], linewidth=3, markersize=8,
              markerfacecolor='white', markeredgecolor=COLORS['secondary'], markeredgewidth=2)
     ax5.fill_between(financial_data['Year'], financial_data['Net_Profit'],
                      alpha=0.3, color=COLORS['secondary'])
 
-    # Add value labels
-    for year, profit in zip(financial_data['Year'], financial_data['Net_Profit']):
-        ax5.annotate(f'₹{profit/100000:.1f}L', (year, profit),
+    # Add value labels; the arrays and label text are prepared up front so the loop only places artists
+    years = financial_data['Year'].to_numpy()
+    profits = financial_data['Net_Profit'].to_numpy()
+    labels = [f'₹{lakh:.1f}L' for lakh in _scale_lakh(profits)]
+    for year, profit, label in zip(years, profits, labels):
+        ax5.annotate(label, (year, profit),
                     textcoords="offset points", xytext=(0,10), ha='center',
                     fontweight='bold', fontsize=9, color='white',
-                    bbox=dict(boxstyle='round,pad=0.2', facecolor=COLORS['secondary'], alpha=0.8))
+                    bbox=_SMALL_BBOX[COLORS['secondary']])
 
     ax5.set_title('Net Profit Trend', fontweight='bold', fontsize=14, color=COLORS['dark'], pad=15)
-    ax5.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/100000:.0f}L'))
+    ax5.yaxis.set_major_formatter(_LAKH_FMT_0)
     ax5.tick_params(axis='x', rotation=35, labelsize=10, colors=COLORS['dark'])
     ax5.tick_params(axis='y', labelsize=10, colors=COLORS['dark'])
     ax5.set_facecolor('#f8f9fa')
@@ -548,21 +664,20 @@ def create_comprehensive_dashboard(financial_data, ratios_data, shareholding_dat
 
     # 6. Enhanced quarterly performance
     ax6 = fig.add_subplot(gs[2, 2:4])
+    _trim(ax6)
     colors_quarterly = [COLORS['primary'], COLORS['accent'], COLORS['secondary']]
     bars = ax6.bar(quarterly_data['Metric'], quarterly_data['Amount_Crores'],
                    color=colors_quarterly, alpha=0.9,
                    edgecolor='white', linewidth=2)
 
     # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        ax6.text(bar.get_x() + bar.get_width()/2., height + 5000,
-                f'₹{height/100000:.1f}L', ha='center', va='bottom',
-                fontweight='bold', fontsize=10, color='white',
-                bbox=dict(boxstyle='round,pad=0.2', facecolor=COLORS['dark'], alpha=0.8))
+    labels = [f'₹{lakh:.1f}L' for lakh in _scale_lakh(quarterly_data['Amount_Crores'].to_numpy())]
+    ax6.bar_label(bars, labels=labels,
+                  padding=4, fontweight='bold', fontsize=10, color='white',
+                  bbox=_SMALL_BBOX[COLORS['dark']])
 
     ax6.set_title('Latest Quarter', fontweight='bold', fontsize=14, color=COLORS['dark'], pad=15)
-    ax6.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'₹{x/100000:.0f}L'))
+    ax6.yaxis.set_major_formatter(_LAKH_FMT_0)
     ax6.tick_params(axis='x', rotation=25, labelsize=10, colors=COLORS['dark'])
     ax6.tick_params(axis='y', labelsize=10, colors=COLORS['dark'])
     ax6.set_facecolor('#f8f9fa')
@@ -581,10 +696,42 @@ ROCE: 9.69% | ROE: 8.40% | Dividend Yield: 0.39%'''
              bbox=dict(boxstyle="round,pad=0.5", facecolor=COLORS['light'],
                       edgecolor=COLORS['primary'], linewidth=2, alpha=0.9))
 
-    plt.savefig(save_path, dpi=300, bbox_inches='tight', facecolor='white')
-    plt.close()
+    # The bottom margin leaves room for the metrics box under the last row
+    fig.subplots_adjust(left=0.075, right=0.99, top=0.92, bottom=0.12, hspace=0.35, wspace=0.3)
+    _save_chart(save_path)
+    fig.clear()
     print(f"✓ Enhanced comprehensive dashboard saved as {save_path}")
 
+# Hash of this script's source, so any code or styling edit invalidates every cached chart
+with open(__file__, 'rb') as _source:
+    _SOURCE_HASH = hashlib.blake2b(_source.read(), digest_size=16).digest()
+
+def _cache_key(fn_name, *dfs):
+    """Content hash of a chart's inputs: its name, the script source and every DataFrame"""
+    digest = hashlib.blake2b(fn_name.encode() + _SOURCE_HASH)
+    for df in dfs:
+        digest.update(pd.util.hash_pandas_object(df).values.tobytes())
+    return digest.hexdigest()
+
+def _cached(key, path):
+    """True when the PNG at path was rendered from inputs with the given key"""
+    try:
+        with open(f"{path}.sha") as sidecar:
+            return sidecar.read() == key and os.path.exists(path)
+    except OSError:
+        return False
+
+def _record(key, path):
+    """Write the cache key sidecar for a freshly saved PNG"""
+    with open(f"{path}.sha", 'w') as sidecar:
+        sidecar.write(key)
+
+def _run(job):
+    """Unpack a (chart function, args, cache key) job, render it and record its key"""
+    chart_fn, args, key = job
+    chart_fn(*args)
+    _record(key, args[-1])
+
 def main():
     """Main function to generate all Reliance Industries infographics"""
     print("🏭 Creating Reliance Industries Financial Infographics...")
@@ -596,28 +743,54 @@ def main():
     # Define save paths
     folder_path = "Reliance Industries"
 
-    # Generate all infographics
-    create_revenue_profit_trend(financial_data,
-                               f"{folder_path}/Reliance_Revenue_Profit_Trend.png")
-
-    create_shareholding_pie_chart(shareholding_data,
-                                 f"{folder_path}/Reliance_Shareholding_Pattern.png")
-
-    create_financial_ratios_chart(ratios_data,
-                                 f"{folder_path}/Reliance_Financial_Ratios.png")
-
-    create_growth_rates_chart(growth_data,
-                             f"{folder_path}/Reliance_Growth_Performance.png")
-
-    create_quarterly_performance_chart(quarterly_data,
-                                      f"{folder_path}/Reliance_Quarterly_Performance.png")
-
-    create_revenue_profit_comparison(financial_data,
-                                    f"{folder_path}/Reliance_Revenue_Profit_Comparison.png")
-
-    create_comprehensive_dashboard(financial_data, ratios_data, shareholding_data,
-                                  growth_data, quarterly_data,
-                                  f"{folder_path}/Reliance_Financial_Dashboard.png")
+    os.makedirs(folder_path, exist_ok=True)
+
+    # Each chart is an independent figure, so render them in parallel
+    jobs = [
+        (create_revenue_profit_trend, (financial_data,
+                                       f"{folder_path}/Reliance_Revenue_Profit_Trend.png")),
+        (create_shareholding_pie_chart, (shareholding_data,
+                                         f"{folder_path}/Reliance_Shareholding_Pattern.png")),
+        (create_financial_ratios_chart, (ratios_data,
+                                         f"{folder_path}/Reliance_Financial_Ratios.png")),
+        (create_growth_rates_chart, (growth_data,
+                                     f"{folder_path}/Reliance_Growth_Performance.png")),
+        (create_quarterly_performance_chart, (quarterly_data,
+                                              f"{folder_path}/Reliance_Quarterly_Performance.png")),
+        (create_revenue_profit_comparison, (financial_data,
+                                            f"{folder_path}/Reliance_Revenue_Profit_Comparison.png")),
+        (create_comprehensive_dashboard, (financial_data, ratios_data, shareholding_data,
+                                          growth_data, quarterly_data,
+                                          f"{folder_path}/Reliance_Financial_Dashboard.png")),
+    ]
+
+    # Skip charts whose PNG was already rendered from identical inputs
+    pending = []
+    for chart_fn, args in jobs:
+        key = _cache_key(chart_fn.__name__, *args[:-1])
+        if _cached(key, args[-1]):
+            print(f"✓ Unchanged, keeping {args[-1]}")
+        else:
+            pending.append((chart_fn, args, key))
+
+    # With a single core, render in order and overlap each PNG encode with the next draw
+    global _WRITER
+    if pending and (os.cpu_count() or 1) == 1:
+        with ThreadPoolExecutor(max_workers=2) as _WRITER:
+            for chart_fn, args, _ in pending:
+                chart_fn(*args)
+            for write in _PENDING_WRITES:
+                write.result()
+        _WRITER = None
+        # Keys are recorded only once every PNG is actually on disk
+        for _, args, key in pending:
+            _record(key, args[-1])
+    # fork lets workers inherit the already-imported matplotlib instead of re-importing it
+    elif pending:
+        start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1),
+                                 mp_context=multiprocessing.get_context(start_method)) as executor:
+            list(executor.map(_run, pending))
 
     print("=" * 70)
     print("✅ All Reliance Industries infographics generated successfully!")